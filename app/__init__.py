@@ -3,9 +3,13 @@ author: @GUU8HC
 """
 #pylint: disable=import-outside-toplevel, line-too-long
 
+import os
+
 from flask import Flask
 
 from app.settings import DEBUG_MODE, USER_DB, SECRET_KEY, SESSION_COOKIE_HTTPONLY, SESSION_COOKIE_SECURE, SESSION_PERMANENT, SESSION_COOKIE_SAMESITE
+from app.settings import PROFILER_ENABLED, PROFILER_SAMPLE_RATE, PROFILER_DIR, PROFILER_MAX_FILES
+from app.settings import BACKUP_ENABLED, BACKUP_DBS, BACKUP_DIR, BACKUP_INTERVAL, BACKUP_KEEP, BACKUP_PAGES, BACKUP_SLEEP
 
 def create_app():
     """
@@ -29,4 +33,24 @@ def create_app():
     from app.wortschatz import wortschatz_bp
     app.register_blueprint(wortschatz_bp, url_prefix='/wortschatz')
 
+    if PROFILER_ENABLED:
+        from app.profiler import profiler_bp
+        from app.profiler.middleware import ProfilerMiddleware
+        app.register_blueprint(profiler_bp, url_prefix='/profiler')
+        app.wsgi_app = ProfilerMiddleware(app.wsgi_app, app.url_map, PROFILER_DIR, PROFILER_SAMPLE_RATE, PROFILER_MAX_FILES)
+
+    if BACKUP_ENABLED:
+        from app.database.backup import Backup
+        backup = Backup(BACKUP_DBS, BACKUP_DIR, BACKUP_KEEP, BACKUP_PAGES, BACKUP_SLEEP)
+        app.extensions['backup'] = backup
+
+        # Start from requests rather than here: with app.run(debug=True) the reloader's
+        # watcher process also calls create_app() but never serves requests.
+        # WERKZEUG_RUN_MAIN alone cannot tell that process apart from a production server.
+        # With several workers only the one holding the lock in BACKUP_DIR schedules
+        # snapshots; the others retry the election once a minute (see backup.py).
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            backup.start(BACKUP_INTERVAL)
+        app.before_request(lambda: backup.start(BACKUP_INTERVAL))
+
     return app
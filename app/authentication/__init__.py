@@ -6,6 +6,12 @@ author: @GUU8HC
 
 from flask import Blueprint
 
+from app.settings import AUTH_IP_RATE, AUTH_IP_BURST, AUTH_USER_RATE, AUTH_USER_BURST, AUTH_MAX_CONCURRENT_HASHES, AUTH_MAX_TRACKED_KEYS
+
+from .admission import AdmissionController
+
 authentication_bp = Blueprint('authentication', __name__, template_folder='templates', static_folder='static')
 
+admission_controller = AdmissionController(AUTH_IP_RATE, AUTH_IP_BURST, AUTH_USER_RATE, AUTH_USER_BURST, AUTH_MAX_CONCURRENT_HASHES, AUTH_MAX_TRACKED_KEYS)
+
 from . import authentication
@@ -0,0 +1,198 @@
+"""
+author: @GUU8HC
+"""
+#pylint: disable=line-too-long
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import request, jsonify
+
+from app.settings import DEBUG_MODE
+
+class TokenBucketStore:
+    """
+    Bounded collection of token buckets keyed by an arbitrary string (IP, username, ...).
+    Buckets are kept in LRU order. A bucket that has been idle long enough to refill
+    completely is indistinguishable from a fresh one, so it is evicted; on top of that
+    the store never holds more than `max_keys` buckets.
+    """
+    def __init__(self, rate, burst, max_keys):
+        """
+        Args:
+            rate (float): Tokens refilled per second.
+            burst (int): Bucket capacity.
+            max_keys (int): Maximum number of buckets kept in memory.
+        """
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.max_keys = max_keys
+        self.idle_ttl = self.burst / self.rate
+        self.buckets = OrderedDict()  # key -> (tokens, updated)
+        self.lock = threading.Lock()
+
+    def wait(self, key, now=None):
+        """
+        Check the bucket of `key` without taking a token.
+        Args:
+            key (str): The bucket key.
+            now (float): Monotonic timestamp, defaults to time.monotonic().
+        Returns:
+            float: 0.0 if a token is available, otherwise seconds until one is.
+        """
+        now = time.monotonic() if now is None else now
+
+        with self.lock:
+            tokens = self.__tokens(key, now)
+
+        return 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate
+
+    def take(self, key, now=None):
+        """
+        Take one token from the bucket of `key`. Nothing is charged or stored
+        when the bucket is empty, so rejected requests cost no memory.
+        Args:
+            key (str): The bucket key.
+            now (float): Monotonic timestamp, defaults to time.monotonic().
+        Returns:
+            float: 0.0 if a token was taken, otherwise seconds until one is available.
+        """
+        now = time.monotonic() if now is None else now
+
+        with self.lock:
+            tokens = self.__tokens(key, now)
+            if tokens < 1.0:
+                return (1.0 - tokens) / self.rate
+
+            self.buckets.pop(key, None)
+            self.buckets[key] = (tokens - 1.0, now)
+            self.__evict(now)
+
+        return 0.0
+
+    def refund(self, key):
+        """
+        Give back a token taken for a request that was rejected later on.
+        """
+        with self.lock:
+            if key in self.buckets:
+                tokens, updated = self.buckets[key]
+                self.buckets[key] = (min(self.burst, tokens + 1.0), updated)
+
+    def __tokens(self, key, now):
+        """
+        Current token count of `key`, refilled up to `now`.
+        """
+        tokens, updated = self.buckets.get(key, (self.burst, now))
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def __evict(self, now):
+        """
+        Drop fully refilled buckets from the LRU end and enforce the size cap.
+        """
+        while self.buckets:
+            key, (_, updated) = next(iter(self.buckets.items()))
+            if len(self.buckets) > self.max_keys or now - updated >= self.idle_ttl:
+                del self.buckets[key]
+            else:
+                break
+
+    def __len__(self):
+        return len(self.buckets)
+
+class AdmissionController:
+    """
+    In-process admission control for routes that run bcrypt.
+    A request is admitted only if both its client IP and its username still have
+    tokens, and if a hashing slot is free. Otherwise it is rejected right away with
+    HTTP 429 instead of queueing behind other hashes.
+    """
+    def __init__(self, ip_rate, ip_burst, user_rate, user_burst, max_concurrent, max_keys):
+        """
+        Args:
+            ip_rate (float): Tokens refilled per second, per client IP.
+            ip_burst (int): Bucket capacity, per client IP.
+            user_rate (float): Tokens refilled per second, per username.
+            user_burst (int): Bucket capacity, per username.
+            max_concurrent (int): Maximum number of concurrent hash operations.
+            max_keys (int): Maximum number of buckets kept per store.
+        """
+        self.ip_buckets = TokenBucketStore(ip_rate, ip_burst, max_keys)
+        self.user_buckets = TokenBucketStore(user_rate, user_burst, max_keys)
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.lock = threading.Lock()
+
+    def admit(self, ip, username):
+        """
+        Charge one token to the IP and one to the username, but only if both
+        buckets have one. A throttled IP can therefore not drain the bucket of
+        someone else's username.
+        Args:
+            ip (str): The client IP address.
+            username (str): The username from the request.
+        Returns:
+            float: 0.0 if admitted, otherwise seconds the client should wait.
+        """
+        ip_key, user_key = self.__keys(ip, username)
+        now = time.monotonic()
+
+        with self.lock:
+            wait = max(self.ip_buckets.wait(ip_key, now), self.user_buckets.wait(user_key, now))
+            if wait > 0:
+                return wait
+
+            self.ip_buckets.take(ip_key, now)
+            self.user_buckets.take(user_key, now)
+
+        return 0.0
+
+    def refund(self, ip, username):
+        """
+        Give back the tokens charged by admit().
+        """
+        ip_key, user_key = self.__keys(ip, username)
+
+        with self.lock:
+            self.ip_buckets.refund(ip_key)
+            self.user_buckets.refund(user_key)
+
+    def guard(self, f):
+        """
+        Decorator for routes taking a `username` argument and running a password hash.
+        """
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            wait = self.admit(request.remote_addr, kwargs.get('username'))
+            if wait > 0:
+                if DEBUG_MODE:
+                    print(f"[DEBUG] admission.py: Throttled {request.remote_addr} / {kwargs.get('username')}")
+                return self.__reject('Too many attempts', wait)
+
+            if not self.slots.acquire(blocking=False):
+                if DEBUG_MODE:
+                    print("[DEBUG] admission.py: All hashing slots busy")
+                self.refund(request.remote_addr, kwargs.get('username'))
+                return self.__reject('Server busy', 1)
+
+            try:
+                return f(*args, **kwargs)
+            finally:
+                self.slots.release()
+        return decorated_function
+
+    def __keys(self, ip, username):
+        """
+        Bucket keys for a request.
+        """
+        return ip or "-", (username or "").lower()
+
+    def __reject(self, error, retry_after):
+        """
+        Build a 429 response in the same shape as the auth routes.
+        """
+        response = jsonify({'result': False, 'error': error})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, int(retry_after + 0.999)))
+        return response
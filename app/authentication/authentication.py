@@ -9,7 +9,7 @@ from app.util import login_user, logout_user
 from app.util import get_git_branch
 from app.settings import DEBUG_MODE
 
-from . import authentication_bp
+from . import authentication_bp, admission_controller
 
 @authentication_bp.route('/obsolete/signin')
 def obsolete_signin():
@@ -26,13 +26,17 @@ def login():
     return render_template('authentication/login.html', gitv=get_git_branch())
 
 @authentication_bp.route('/login/<username>/<password>', methods=['GET'])
+@admission_controller.guard
 def authenticate(username, password):
     """
     route: /auth/login/<username>/<password>
     """
-    login_user(username)
     result = authenticator.authenticate(username, password)
 
+    # Only open a session once the password has been checked
+    if result:
+        login_user(username)
+
     if DEBUG_MODE:
         print(f"[DEBUG] authentication.py: Authentication result: {result}")
 
@@ -46,6 +50,7 @@ def registration():
     return render_template('authentication/registration.html', gitv=get_git_branch())
 
 @authentication_bp.route('/registration/<username>/<password>', methods=['GET'])
+@admission_controller.guard
 def register(username, password):
     """
     route: /auth/registration/<username>/<password>
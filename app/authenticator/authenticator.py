@@ -40,9 +40,12 @@ class Authenticator:
         Returns:
             bool: True if the password matches the hashed password, False otherwise.
         """
+        # checkpw is expensive, run it only once
+        result = checkpw(password.encode(), hashed_password.encode())
+
         if DEBUG_MODE:
-            print(f"[DEBUG] authenticator.py: Verifying password: {checkpw(password.encode(), hashed_password.encode())}")
-        return checkpw(password.encode(), hashed_password.encode())
+            print(f"[DEBUG] authenticator.py: Verifying password: {result}")
+        return result
 
     def authenticate(self, username, password):
         """
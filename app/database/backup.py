@@ -0,0 +1,253 @@
+"""
+author: @GUU8HC
+online backups of the SQLite databases
+
+usage (from the project root, database paths are relative to it):
+    python -m app.database.backup
+
+The scheduler started by create_app() runs in one process only: every
+process tries to take an exclusive lock on BACKUP_DIR/.scheduler.lock and
+only the holder takes snapshots. Others retry the election once a minute, so
+a new process takes over if the scheduler process exits. Deployments that
+would rather not rely on this can keep BACKUP_ENABLED off and run the
+command above from cron.
+"""
+#pylint: disable=line-too-long
+#pylint: disable=broad-exception-caught
+
+import gzip
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from urllib.request import pathname2url
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from app.settings import DEBUG_MODE
+
+SUFFIX = ".db.gz"
+LOCK_FILE = ".scheduler.lock"
+ELECTION_RETRY = 60  # seconds between attempts to become the scheduler
+
+class Backup:
+    """
+    Snapshots SQLite databases with the online backup API.
+    The copy runs on its own connection, `pages` pages per step, and sleeps
+    `sleep` seconds after every step (from the progress callback, since
+    Connection.backup itself only sleeps on BUSY/LOCKED), so the application's
+    connection only ever waits for one short step. Each snapshot is checked
+    with PRAGMA integrity_check, gzip-compressed and rotated so that at most
+    `keep` are kept per database.
+    """
+    def __init__(self, dbs, directory, keep=7, pages=64, sleep=0.05):
+        """
+        Args:
+            dbs (list): Paths of the databases to back up.
+            directory (str): Where snapshots are written.
+            keep (int): Number of snapshots kept per database.
+            pages (int): Pages copied per backup step.
+            sleep (float): Seconds to sleep between steps.
+        """
+        self.dbs = dbs
+        self.directory = directory
+        self.keep = keep
+        self.pages = pages
+        self.sleep = sleep
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.lock_file = None
+        self.last_election = None
+
+    def snapshot(self, db):
+        """
+        Create one verified, compressed snapshot of a database.
+        Args:
+            db (str): Path of the database.
+        Returns:
+            str: Path of the snapshot.
+        Raises:
+            FileNotFoundError: If the database does not exist.
+            sqlite3.DatabaseError: If the copy fails its integrity check.
+        """
+        # never let a wrong working directory produce "verified" snapshots of an empty stub
+        if not os.path.isfile(db):
+            raise FileNotFoundError(f"database {os.path.abspath(db)} does not exist")
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        name = os.path.splitext(os.path.basename(db))[0]
+        target = os.path.join(self.directory, f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{SUFFIX}")
+
+        # private temp files, so concurrent snapshots (e.g. two processes) never share a path
+        temps = []
+        for suffix in (".db.tmp", ".gz.tmp"):
+            handle, path = tempfile.mkstemp(prefix=f"{name}-", suffix=suffix, dir=self.directory)
+            os.close(handle)
+            temps.append(path)
+        copy, compressed_copy = temps
+
+        try:
+            self.__copy(db, copy)
+            self.__verify(copy)
+
+            with open(copy, 'rb') as source, gzip.open(compressed_copy, 'wb') as compressed:
+                shutil.copyfileobj(source, compressed)
+            os.replace(compressed_copy, target)
+        finally:
+            for leftover in temps:
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+        self.__rotate(name)
+
+        if DEBUG_MODE:
+            print(f"[DEBUG] backup.py: snapshot of {db} written to {target}")
+        return target
+
+    def snapshot_all(self):
+        """
+        Snapshot every configured database. Errors are logged, not raised.
+        Returns:
+            list: Paths of the snapshots that were written.
+        """
+        written = []
+        for db in self.dbs:
+            try:
+                written.append(self.snapshot(db))
+            except Exception as e:
+                print(f"[ERROR] backup.py: snapshot of {db} failed: {e}")
+        return written
+
+    def start(self, interval):
+        """
+        Snapshot all databases right away and then every `interval` seconds in a
+        daemon thread, if this process wins the scheduler election. Calling it
+        again while the thread runs does nothing, and a lost election is only
+        retried every ELECTION_RETRY seconds, so it is cheap to call per request.
+        """
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+
+            now = time.monotonic()
+            if self.last_election is not None and now - self.last_election < ELECTION_RETRY:
+                return
+            self.last_election = now
+
+            if not self.__elect():
+                if DEBUG_MODE:
+                    print(f"[DEBUG] backup.py: another process schedules backups in {self.directory}")
+                return
+
+            def run():
+                while True:
+                    self.snapshot_all()
+                    if self.stop_event.wait(interval):
+                        break
+
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=run, name="backup", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """
+        Stop the background thread after the current snapshot.
+        """
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+
+        with self.lock:
+            if self.lock_file:
+                self.lock_file.close()  # releases the scheduler lock
+                self.lock_file = None
+
+    def __elect(self):
+        """
+        Try to take the exclusive scheduler lock in the backup directory.
+        The lock is held until stop() or until the process exits.
+        Returns:
+            bool: True if this process is the scheduler.
+        """
+        if self.lock_file:
+            return True
+
+        os.makedirs(self.directory, exist_ok=True)
+        lock_file = open(os.path.join(self.directory, LOCK_FILE), 'a+b')
+        try:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+
+        self.lock_file = lock_file
+        return True
+
+    def __copy(self, db, temp):
+        """
+        Copy a database page range by page range into temp.
+        The source is opened read-only, so a missing file is an error rather than a new empty database.
+        """
+        source = sqlite3.connect(f"file:{pathname2url(os.path.abspath(db))}?mode=ro", uri=True)
+        target = sqlite3.connect(temp)
+
+        def pause(_status, remaining, _total):
+            # give writers room between steps
+            if remaining:
+                time.sleep(self.sleep)
+
+        try:
+            source.backup(target, pages=self.pages, progress=pause, sleep=self.sleep)
+        finally:
+            target.close()
+            source.close()
+
+    def __verify(self, temp):
+        """
+        Run an integrity check on a finished copy.
+        """
+        connection = sqlite3.connect(temp)
+        try:
+            result = connection.execute("PRAGMA integrity_check;").fetchall()
+        finally:
+            connection.close()
+
+        if result != [("ok",)]:
+            raise sqlite3.DatabaseError(f"integrity check failed: {result[:5]}")
+
+    def __rotate(self, name):
+        """
+        Delete the oldest snapshots of a database beyond `keep`.
+        """
+        prefix = f"{name}-"
+        snapshots = sorted(
+            entry for entry in os.listdir(self.directory)
+            if entry.startswith(prefix) and entry.endswith(SUFFIX) and entry[len(prefix):-len(SUFFIX)].replace('-', '').isdigit()
+        )
+        for entry in snapshots[:max(0, len(snapshots) - self.keep)]:
+            try:
+                os.remove(os.path.join(self.directory, entry))
+            except FileNotFoundError:
+                pass  # rotated by a concurrent snapshot
+
+# This is executed only when the script is run directly
+if __name__ == "__main__":
+    from app.settings import BACKUP_DBS, BACKUP_DIR, BACKUP_KEEP, BACKUP_PAGES, BACKUP_SLEEP
+
+    snapshots = Backup(BACKUP_DBS, BACKUP_DIR, BACKUP_KEEP, BACKUP_PAGES, BACKUP_SLEEP).snapshot_all()
+    for path in snapshots:
+        print(f"[INFO] backup.py: {path}")
+    sys.exit(0 if len(snapshots) == len(BACKUP_DBS) else 1)
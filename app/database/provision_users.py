@@ -0,0 +1,162 @@
+"""
+author: @GUU8HC
+bulk user provisioning
+
+usage (from the project root, database paths are relative to it):
+    python -m app.database.provision_users users.csv
+    python -m app.database.provision_users users.jsonl --workers 8 --batch-size 1000
+
+CSV files need a header with `username` and `password` columns, JSONL files
+one {"username": ..., "password": ...} object per line.
+Passwords are hashed with bcrypt across a process pool and inserted in
+batched transactions. Rows that fail are reported with their line number.
+"""
+#pylint: disable=import-outside-toplevel
+#pylint: disable=line-too-long
+#pylint: disable=broad-exception-caught
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from bcrypt import gensalt, hashpw
+
+# bcrypt only uses the first 72 bytes, bcrypt >= 5 rejects longer input
+MAX_PASSWORD_BYTES = 72
+
+def hash_password(password):
+    """
+    Hashes a password the same way as Authenticator.hash_password.
+    Module level so it can be sent to worker processes.
+    Returns:
+        tuple: (hashed password, None), or (None, error message) if hashing failed,
+            so that one bad row cannot abort the whole pool.map.
+    """
+    try:
+        return hashpw(password.encode(), gensalt()).decode('utf-8'), None
+    except Exception as e:
+        return None, f"hashing failed: {e}"
+
+def read_users(path):
+    """
+    Reads (line, username, password) rows from a CSV or JSONL file.
+    Returns:
+        tuple: ([(line, username, password)], [(line, None, reason)] for unparsable lines)
+    """
+    rows, failures = [], []
+    with open(path, newline='', encoding='utf-8') as file:
+        if path.endswith('.jsonl'):
+            for line, text in enumerate(file, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    record = json.loads(text)
+                    rows.append((line, record.get('username'), record.get('password')))
+                except (ValueError, AttributeError) as e:
+                    failures.append((line, None, f"invalid JSON: {e}"))
+        else:
+            # line 1 is the header
+            for line, record in enumerate(csv.DictReader(file), start=2):
+                rows.append((line, record.get('username'), record.get('password')))
+    return rows, failures
+
+def validate(rows, existing):
+    """
+    Splits rows into valid ones and failures.
+    Returns:
+        tuple: ([(line, username, password)], [(line, username, reason)])
+    """
+    valid, failures, seen = [], [], set()
+    for line, username, password in rows:
+        username = username.strip() if isinstance(username, str) else None
+        if not username:
+            failures.append((line, None, "missing username"))
+        elif not isinstance(password, str) or not password:
+            failures.append((line, username, "missing password"))
+        elif len(password.encode()) > MAX_PASSWORD_BYTES:
+            failures.append((line, username, f"password longer than {MAX_PASSWORD_BYTES} bytes"))
+        elif username in seen:
+            failures.append((line, username, "duplicate username in input"))
+        elif username in existing:
+            failures.append((line, username, "user already exists"))
+        else:
+            seen.add(username)
+            valid.append((line, username, password))
+    return valid, failures
+
+def provision(db, rows, workers=None, batch_size=1000):
+    """
+    Hashes and inserts users.
+    Args:
+        db (User): The user database.
+        rows (list): (line, username, password) tuples from read_users.
+        workers (int): Number of hashing processes, defaults to the CPU count.
+        batch_size (int): Number of users inserted per transaction.
+    Returns:
+        tuple: (number of users created, [(line, username, reason)] failures)
+    """
+    existing = db.get_existing_usernames(username.strip() for _, username, _ in rows if isinstance(username, str))
+    valid, failures = validate(rows, existing)
+
+    created = 0
+    lines = {username: line for line, username, _ in valid}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        hashes = pool.map(hash_password, [password for _, _, password in valid], chunksize=32)
+
+        batch = []
+        for (line, username, _), (hashed, error) in zip(valid, hashes):
+            if error:
+                failures.append((line, username, error))
+                continue
+            batch.append((username, hashed))
+            if len(batch) >= batch_size:
+                created += _insert(db, batch, lines, failures)
+                batch = []
+        if batch:
+            created += _insert(db, batch, lines, failures)
+
+    failures.sort(key=lambda failure: failure[0])
+    return created, failures
+
+def _insert(db, batch, lines, failures):
+    """
+    Inserts one batch and records its failures.
+    Returns:
+        int: Number of users created.
+    """
+    rejected = db.create_users(batch)
+    failures.extend((lines[username], username, error) for username, error in rejected)
+    print(f"[INFO] provision_users.py: inserted {len(batch) - len(rejected)}/{len(batch)} users", flush=True)
+    return len(batch) - len(rejected)
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Create users in bulk from a CSV or JSONL file.")
+    parser.add_argument('file', help="CSV (username,password header) or .jsonl file")
+    parser.add_argument('--workers', type=int, default=None, help="hashing processes (default: CPU count)")
+    parser.add_argument('--batch-size', type=int, default=1000, help="users per transaction (default: 1000)")
+    args = parser.parse_args(argv)
+
+    from app.database import user_db
+
+    rows, unparsable = read_users(args.file)
+    created, failures = provision(user_db, rows, args.workers, args.batch_size)
+    failures = sorted(unparsable + failures, key=lambda failure: failure[0])
+
+    for line, username, reason in failures:
+        print(f"[ERROR] provision_users.py: line {line}: {username or '-'}: {reason}", file=sys.stderr)
+    print(f"[INFO] provision_users.py: {created} users created, {len(failures)} failed")
+
+    return 1 if failures else 0
+
+# This is executed only when the script is run directly
+if __name__ == "__main__":
+    # Add the root directory of the project to sys.path
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+    sys.exit(main())
@@ -107,6 +107,59 @@ class User(DBInterface):
             print(f"[ERROR] {FILE_NAME}: create_user: {e}")
             return False
 
+    def get_existing_usernames(self, usernames):
+        """
+        Finds which of the given usernames already exist in the database.
+        Args:
+            usernames (list): The usernames to look up.
+        Returns:
+            set: The usernames that already exist.
+        """
+        usernames = list(usernames)
+        existing = set()
+
+        # stay below SQLite's limit on bound parameters
+        for start in range(0, len(usernames), 500):
+            chunk = usernames[start:start + 500]
+            query = f"SELECT username FROM {self.table_user} WHERE username IN ({', '.join('?' * len(chunk))});"
+            self.cursor.execute(query, chunk)
+            existing.update(row[0] for row in self.cursor.fetchall())
+
+        return existing
+
+    def create_users(self, users):
+        """
+        Creates many user records in a single transaction.
+        If the batch fails as a whole, it is rolled back and retried row by row
+        so that only the offending rows are rejected.
+        Args:
+            users (list): (username, hashed_password) tuples.
+        Returns:
+            list: (username, error) tuples for the rows that could not be created.
+        """
+        query = f"INSERT INTO {self.table_user} (userid, username, password) VALUES (?, ?, ?);"
+        rows = [(username, username, password) for username, password in users]
+
+        if DEBUG_MODE:
+            print(f"[DEBUG] {FILE_NAME}: create_users: {query} with {len(rows)} users")
+
+        try:
+            self.cursor.executemany(query, rows)
+            self.connection.commit()
+            return []
+        except Exception as e:
+            print(f"[ERROR] {FILE_NAME}: create_users: {e}, retrying row by row")
+            self.connection.rollback()
+
+        failures = []
+        for row in rows:
+            try:
+                self.cursor.execute(query, row)
+            except Exception as e:
+                failures.append((row[1], str(e)))
+        self.connection.commit()
+        return failures
+
     def remove_user(self, username):
         """
         Removes a user record from the database by username.
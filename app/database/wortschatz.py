@@ -6,6 +6,8 @@ author: @GUU8HC
 # pylint: disable=line-too-long
 # pylint: disable=broad-exception-caught
 
+import threading
+
 from app.settings import DEBUG_MODE
 
 from .db_interface import DBInterface
@@ -24,6 +26,106 @@ class Wortschatz(DBInterface):
     def __init__(self, db):
         super().__init__(db)
         self.table_wortschatz = "DE_EN"
+        self.listeners = []
+        # held across each write and its notification, so readers that rebuild
+        # derived data can never see a write whose listeners have not run yet
+        self.write_lock = threading.RLock()
+
+    def on_change(self, listener):
+        """
+        Register a callback for vocabulary writes made through this class.
+        Args:
+            listener (callable): Called as listener(old_row, new_row), where a row is
+                (de, gender, en, keywords) and old_row / new_row is None for inserts / deletes.
+                Listeners run while write_lock is held.
+        """
+        self.listeners.append(listener)
+
+    def data_version(self):
+        """
+        Returns:
+            int: SQLite's data version, which changes whenever another connection commits.
+        """
+        self.cursor.execute("PRAGMA data_version;")
+        return self.cursor.fetchone()[0]
+
+    def get_all_keywords(self):
+        """
+        Retrieves the keywords column of every word.
+        Returns:
+            list: A list of keyword strings (comma-separated, may be None).
+        """
+        query = f"SELECT keywords FROM {self.table_wortschatz};"
+
+        if DEBUG_MODE:
+            print(f"[DEBUG] {FILE_NAME}: get_all_keywords: {query}")
+
+        self.cursor.execute(query)
+        return [row[0] for row in self.cursor.fetchall()]
+
+    def get_word(self, de):
+        """
+        Retrieves a word by its German headword.
+        Returns:
+            tuple: (de, gender, en, keywords), or None if the word does not exist.
+        """
+        query = f"SELECT de, gender, en, keywords FROM {self.table_wortschatz} WHERE de = ?;"
+        self.cursor.execute(query, (de,))
+        return self.cursor.fetchone()
+
+    def add_word(self, de, gender, en, keywords):
+        """
+        Inserts a word, or replaces it if the German headword already exists.
+        Returns:
+            bool: True if the word was written successfully, False otherwise.
+        """
+        query = f"INSERT OR REPLACE INTO {self.table_wortschatz} (de, gender, en, keywords) VALUES (?, ?, ?, ?);"
+
+        if DEBUG_MODE:
+            print(f"[DEBUG] {FILE_NAME}: add_word: {query} with de: {de}")
+
+        with self.write_lock:
+            try:
+                old_row = self.get_word(de)
+                self.cursor.execute(query, (de, gender, en, keywords))
+                self.connection.commit()
+            except Exception as e:
+                print(f"[ERROR] {FILE_NAME}: add_word: {e}")
+                return False
+
+            self.__notify(old_row, (de, gender, en, keywords))
+        return True
+
+    def remove_word(self, de):
+        """
+        Removes a word by its German headword.
+        Returns:
+            bool: True if the word was removed successfully, False otherwise.
+        """
+        query = f"DELETE FROM {self.table_wortschatz} WHERE de = ?;"
+
+        if DEBUG_MODE:
+            print(f"[DEBUG] {FILE_NAME}: remove_word: {query} with de: {de}")
+
+        with self.write_lock:
+            try:
+                old_row = self.get_word(de)
+                self.cursor.execute(query, (de,))
+                self.connection.commit()
+            except Exception as e:
+                print(f"[ERROR] {FILE_NAME}: remove_word: {e}")
+                return False
+
+            if old_row:
+                self.__notify(old_row, None)
+        return True
+
+    def __notify(self, old_row, new_row):
+        """
+        Forward a write to all registered listeners.
+        """
+        for listener in self.listeners:
+            listener(old_row, new_row)
 
     def get_all(self):
         query = f"SELECT * FROM {self.table_wortschatz};"
@@ -0,0 +1,10 @@
+"""
+author: @GUU8HC
+"""
+#pylint: disable=wrong-import-position
+
+from flask import Blueprint
+
+profiler_bp = Blueprint('profiler', __name__)
+
+from . import profiler
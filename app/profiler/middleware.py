@@ -0,0 +1,173 @@
+"""
+author: @GUU8HC
+"""
+#pylint: disable=line-too-long
+#pylint: disable=broad-exception-caught
+
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+
+from app.settings import DEBUG_MODE
+
+SEPARATOR = "__"
+SUFFIX = ".prof"
+
+class ProfilerMiddleware:
+    """
+    WSGI middleware profiling a random fraction of requests with cProfile.
+    Each sampled request is written as a pstats file named
+        <timestamp_ms>__<latency_us>__<method>__<route>.prof
+    into a directory that keeps at most `max_files` profiles (oldest deleted first).
+    The route is the matched URL rule, e.g. auth_login_username_password, so
+    path parameters such as passwords never end up on disk.
+    Only one request is profiled at a time; samples that would overlap are
+    skipped, which keeps the overhead bounded under load.
+    A profile covers the request until the server has sent the body and closed
+    it, so streamed responses are profiled without being buffered.
+    """
+    def __init__(self, wsgi_app, url_map, directory, sample_rate, max_files, skip_prefix="/profiler"):
+        """
+        Args:
+            wsgi_app: The wrapped WSGI application.
+            url_map: The Flask app's url_map, used to tag profiles with their route.
+            directory (str): Where profiles are written.
+            sample_rate (float): Fraction of requests to profile, 0.0 - 1.0.
+            max_files (int): Maximum number of profiles kept in the directory.
+            skip_prefix (str): Requests under this path are never profiled.
+        """
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_files = max_files
+        self.skip_prefix = skip_prefix
+        self.busy = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __call__(self, environ, start_response):
+        if random.random() >= self.sample_rate or environ.get('PATH_INFO', '').startswith(self.skip_prefix):
+            return self.wsgi_app(environ, start_response)
+
+        if not self.busy.acquire(blocking=False):
+            return self.wsgi_app(environ, start_response)
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+
+        def finish():
+            profiler.disable()
+            try:
+                self.__dump(profiler, environ, time.perf_counter() - start)
+            finally:
+                self.busy.release()
+
+        profiler.enable()
+        try:
+            iterable = self.wsgi_app(environ, start_response)
+        except BaseException:
+            finish()
+            raise
+
+        # the body is streamed as usual, the profile ends when the server closes it
+        return ProfiledResponse(iterable, finish)
+
+    def __dump(self, profiler, environ, latency):
+        """
+        Write one profile and rotate the directory.
+        """
+        name = SEPARATOR.join([
+            str(int(time.time() * 1000)),
+            str(int(latency * 1_000_000)),
+            environ.get('REQUEST_METHOD', 'GET'),
+            self.__route(environ),
+        ]) + SUFFIX
+
+        try:
+            profiler.dump_stats(os.path.join(self.directory, name))
+            self.__rotate()
+        except Exception as e:
+            print(f"[ERROR] middleware.py: could not write profile {name}: {e}")
+            return
+
+        if DEBUG_MODE:
+            print(f"[DEBUG] middleware.py: Profiled {name}")
+
+    def __route(self, environ):
+        """
+        Get the URL rule matching the request as a file name safe string.
+        """
+        try:
+            rule, _ = self.url_map.bind_to_environ(environ).match(return_rule=True)
+            route = rule.rule
+        except Exception:
+            route = "unmatched"
+        return re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or "root"
+
+    def __rotate(self):
+        """
+        Delete the oldest profiles beyond max_files.
+        """
+        names = sorted(name for name in os.listdir(self.directory) if name.endswith(SUFFIX))
+        for name in names[:max(0, len(names) - self.max_files)]:
+            os.remove(os.path.join(self.directory, name))
+
+class ProfiledResponse:
+    """
+    WSGI response body wrapper that ends a profile when the server closes it.
+    """
+    def __init__(self, iterable, finish):
+        """
+        Args:
+            iterable: The wrapped response body.
+            finish (callable): Called exactly once, after the body has been closed.
+        """
+        self.iterable = iterable
+        self.finish = finish
+
+    def __iter__(self):
+        return iter(self.iterable)
+
+    def close(self):
+        """
+        Close the wrapped body, then finish the profile.
+        """
+        finish, self.finish = self.finish, None
+        try:
+            if hasattr(self.iterable, 'close'):
+                self.iterable.close()
+        finally:
+            if finish:
+                finish()
+
+def list_profiles(directory, limit=20):
+    """
+    List the slowest profiles in a directory.
+    Args:
+        directory (str): The profile directory.
+        limit (int): Maximum number of entries.
+    Returns:
+        list: Dictionaries with name, timestamp (ms), latency_ms, method and route, slowest first.
+    """
+    if not os.path.isdir(directory):
+        return []
+
+    profiles = []
+    for name in os.listdir(directory):
+        parts = name[:-len(SUFFIX)].split(SEPARATOR) if name.endswith(SUFFIX) else []
+        if len(parts) != 4 or not parts[0].isdigit() or not parts[1].isdigit():
+            continue
+        profiles.append({
+            "name": name,
+            "timestamp": int(parts[0]),
+            "latency_ms": int(parts[1]) / 1000,
+            "method": parts[2],
+            "route": parts[3],
+        })
+
+    profiles.sort(key=lambda profile: profile["latency_ms"], reverse=True)
+    return profiles[:max(0, limit)]
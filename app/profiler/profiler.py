@@ -0,0 +1,51 @@
+"""
+author: @GUU8HC
+"""
+
+import os
+from functools import wraps
+
+from flask import jsonify, request, send_from_directory, session
+
+from app.util import login_required
+from app.settings import PROFILER_DIR, PROFILER_ADMINS, PROFILER_MAX_FILES
+
+from . import profiler_bp
+from .middleware import list_profiles
+
+def admin_required(f):
+    """
+    Decorator restricting a route to the users listed in PROFILER_ADMINS.
+    Profiles expose internal code paths and timings, so being logged in is not enough.
+    """
+    @wraps(f)
+    @login_required
+    def decorated_function(*args, **kwargs):
+        if session['user_id'] not in PROFILER_ADMINS:
+            return jsonify({'error': 'Forbidden'}), 403
+        return f(*args, **kwargs)
+    return decorated_function
+
+@profiler_bp.route('/')
+@admin_required
+def profiles():
+    """
+    List the slowest recent profiles.
+
+    Endpoint: profiler/?limit=<limit>
+
+    Returns:
+        json: {"profiles": [{"name", "timestamp", "latency_ms", "method", "route"}]}
+    """
+    limit = max(0, min(request.args.get('limit', 20, type=int), PROFILER_MAX_FILES))
+    return jsonify({'profiles': list_profiles(PROFILER_DIR, limit)})
+
+@profiler_bp.route('/<name>')
+@admin_required
+def download(name):
+    """
+    Download a profile as a pstats file, e.g. for snakeviz or flameprof.
+
+    Endpoint: profiler/<name>
+    """
+    return send_from_directory(os.path.abspath(PROFILER_DIR), name, as_attachment=True)
@@ -14,3 +14,33 @@ SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SECURE = False  # Set to True only in production with HTTPS
 SESSION_PERMANENT = False
 SESSION_COOKIE_SAMESITE = 'Lax'  # Less restrictive than 'Strict', works better with Safari
+
+# Admission control for CPU-heavy auth routes (bcrypt)
+AUTH_IP_RATE = 1.0              # tokens refilled per second, per client IP
+AUTH_IP_BURST = 10              # bucket capacity, per client IP
+AUTH_USER_RATE = 0.2            # tokens refilled per second, per username
+AUTH_USER_BURST = 5             # bucket capacity, per username
+AUTH_MAX_CONCURRENT_HASHES = 4  # global cap on concurrent bcrypt operations
+AUTH_MAX_TRACKED_KEYS = 10000   # upper bound on buckets kept in memory per store
+
+# Answer scoring: largest edit distance still counted as a near miss
+ANSWER_MAX_TYPOS = 2
+
+# Autocomplete: maximum number of suggestions per request
+SUGGEST_LIMIT = 10
+
+# Sampling request profiler (cProfile), off by default
+PROFILER_ENABLED = False
+PROFILER_SAMPLE_RATE = 0.01          # fraction of requests to profile
+PROFILER_DIR = "app/profiler/profiles"
+PROFILER_MAX_FILES = 200             # oldest profiles are deleted beyond this
+PROFILER_ADMINS = []                 # usernames allowed to list and download profiles
+
+# Online backups of the SQLite databases, off by default
+BACKUP_ENABLED = False
+BACKUP_DBS = [USER_DB]                  # databases to snapshot
+BACKUP_DIR = "app/database/backups"
+BACKUP_INTERVAL = 6 * 60 * 60           # seconds between snapshots
+BACKUP_KEEP = 7                         # snapshots kept per database
+BACKUP_PAGES = 64                       # pages copied per backup step
+BACKUP_SLEEP = 0.05                     # seconds to sleep between steps
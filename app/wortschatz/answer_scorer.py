@@ -0,0 +1,245 @@
+"""
+author: @guu8hc
+"""
+
+import threading
+
+from .normalizer import normalize_german
+
+ARTICLES = ("der", "die", "das")
+
+CORRECT = "correct"
+NEAR_MISS = "near-miss"
+WRONG = "wrong"
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance restricted to a diagonal band of width 2 * limit + 1.
+    Args:
+        a (str): First word.
+        b (str): Second word.
+        limit (int): Largest distance of interest.
+    Returns:
+        int: The distance, or limit + 1 if it is larger than limit.
+    """
+    if a == b:
+        return 0
+
+    too_far = limit + 1
+    if abs(len(a) - len(b)) > limit:
+        return too_far
+
+    # shorter word first so the band covers the whole row
+    if len(a) > len(b):
+        a, b = b, a
+
+    previous = [j if j <= limit else too_far for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+
+        row_min = current[0]
+        char = a[i - 1]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            value = previous[j - 1] + (char != b[j - 1])
+            value = min(value, previous[j] + 1, current[j - 1] + 1, too_far)
+            current[j] = value
+            row_min = min(row_min, value)
+
+        if row_min > limit:
+            return too_far
+        previous = current
+
+    return previous[-1]
+
+def deletes(word: str, max_distance: int) -> set:
+    """
+    All strings obtained by removing up to max_distance characters from word.
+    """
+    found = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        found |= frontier
+    return found
+
+class DeleteIndex:
+    """
+    Symmetric delete index ("SymSpell") over normalized words.
+    If two words are within distance k, removing at most k characters from each
+    yields a common string. Every word is therefore stored under the deletes of
+    its key strings, and a lookup only has to generate the deletes of the query
+    and verify the few candidates it hits with the banded Levenshtein.
+    To bound memory, the key strings are the first and the last `affix_length`
+    characters rather than the whole word. Prefixes (and suffixes) of two words
+    within distance k are again within k deletes of a common string, so a match
+    is always found under both, and only words matching on both sides are
+    verified. The suffix side keeps compounds that share a stem ("Haustür",
+    "Haushalt", ...) from all landing in the same candidate list.
+    """
+    def __init__(self, words=(), max_distance=2, affix_length=7):
+        self.max_distance = max_distance
+        self.affix_length = affix_length
+        self.words = set()
+        self.prefixes = {}  # delete of prefix -> list of words
+        self.suffixes = {}  # delete of suffix -> list of words
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        """
+        Insert a word into the index. Duplicates are ignored.
+        """
+        if word in self.words:
+            return
+        self.words.add(word)
+        for key in deletes(word[:self.affix_length], self.max_distance):
+            self.prefixes.setdefault(key, []).append(word)
+        for key in deletes(word[-self.affix_length:], self.max_distance):
+            self.suffixes.setdefault(key, []).append(word)
+
+    def remove(self, word: str):
+        """
+        Remove a word from the index, if present.
+        """
+        if word not in self.words:
+            return
+        self.words.discard(word)
+        for index, affix in ((self.prefixes, word[:self.affix_length]), (self.suffixes, word[-self.affix_length:])):
+            for key in deletes(affix, self.max_distance):
+                bucket = index.get(key)
+                if bucket and word in bucket:
+                    bucket.remove(word)
+                    if not bucket:
+                        del index[key]
+
+    def search(self, word: str, max_distance: int) -> list:
+        """
+        Find all words within max_distance of word (capped at the index distance).
+        Returns:
+            list: (distance, word) tuples sorted by distance, then word.
+        """
+        max_distance = min(max_distance, self.max_distance)
+
+        by_prefix = set()
+        for key in deletes(word[:self.affix_length], max_distance):
+            by_prefix.update(self.prefixes.get(key, ()))
+        if not by_prefix:
+            return []
+
+        by_suffix = set()
+        for key in deletes(word[-self.affix_length:], max_distance):
+            by_suffix.update(self.suffixes.get(key, ()))
+
+        found = []
+        for candidate in by_prefix & by_suffix:
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            distance = bounded_levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+        return sorted(found)
+
+    def __len__(self):
+        return len(self.words)
+
+class AnswerScorer:
+    """
+    Scores answers as correct / near-miss / wrong and suggests the word the user
+    most likely meant, using a delete index over all normalized German headwords.
+    Writes (apply) are serialized by a lock; lookups do not take it.
+    """
+    def __init__(self, words, max_typos=2):
+        """
+        Args:
+            words (iterable): German headwords, e.g. DE_EN.de.
+            max_typos (int): Largest edit distance still counted as a near miss.
+        """
+        self.max_typos = max_typos
+        self.headwords = {}  # normalized -> original
+        for word in words:
+            if word:
+                self.headwords.setdefault(normalize_german(word), word)
+        self.index = DeleteIndex(self.headwords, max_distance=max_typos)
+        self.lock = threading.Lock()
+
+    def apply(self, old_row, new_row):
+        """
+        Follow a single vocabulary write (Wortschatz.on_change listener).
+        Rows are (de, gender, en, keywords); old_row / new_row is None for inserts / deletes.
+        """
+        with self.lock:
+            if old_row and old_row[0]:
+                key = normalize_german(old_row[0])
+                if self.headwords.get(key) == old_row[0]:
+                    del self.headwords[key]
+                    self.index.remove(key)
+
+            if new_row and new_row[0]:
+                key = normalize_german(new_row[0])
+                if key not in self.headwords:
+                    self.headwords[key] = new_row[0]
+                    self.index.add(key)
+
+    def allowed_typos(self, word: str) -> int:
+        """
+        Edit budget for a word: one typo per four letters, at least one, at most max_typos.
+        """
+        return min(self.max_typos, max(1, len(word) // 4))
+
+    def suggest(self, answer: str):
+        """
+        Suggest the headword closest to answer, ignoring a leading article.
+        Returns:
+            str: The original headword, or None if nothing is close enough.
+        """
+        word = self.__strip_article(normalize_german(answer))
+        if word in self.headwords:
+            return self.headwords[word]
+
+        matches = self.index.search(word, self.allowed_typos(word))
+        # .get: the match may have been removed by a concurrent write
+        return self.headwords.get(matches[0][1]) if matches else None
+
+    def score(self, expectation: str, answer: str) -> dict:
+        """
+        Score an answer against the expected phrase (article included).
+        The article is what the trainer tests, so it has to match exactly; only
+        the noun is allowed typos.
+        e.g.:
+            score("die Katze", "die Katz") -> near-miss, distance 1
+            score("der Hund", "die Hund")  -> wrong
+        Returns:
+            dict: {"verdict": ..., "distance": int or None, "suggestion": str or None}
+        """
+        expected_article, expected_word = self.__split_article(normalize_german(expectation))
+        article, word = self.__split_article(normalize_german(answer))
+
+        budget = self.allowed_typos(expected_word)
+        distance = bounded_levenshtein(word, expected_word, budget)
+
+        if article != expected_article:
+            # the noun was known, only the gender is wrong: nothing to suggest
+            suggestion = None if distance <= budget else self.suggest(word)
+            return {"verdict": WRONG, "distance": None, "suggestion": suggestion}
+        if distance == 0:
+            return {"verdict": CORRECT, "distance": 0, "suggestion": None}
+        if distance <= budget:
+            return {"verdict": NEAR_MISS, "distance": distance, "suggestion": None}
+        return {"verdict": WRONG, "distance": None, "suggestion": self.suggest(word)}
+
+    def __split_article(self, phrase: str) -> tuple:
+        """
+        Split a leading definite article off a normalized phrase.
+        Returns:
+            tuple: (article or None, rest of the phrase)
+        """
+        head, _, tail = phrase.partition(" ")
+        return (head, tail) if head in ARTICLES and tail else (None, phrase)
+
+    def __strip_article(self, phrase: str) -> str:
+        """
+        Remove a leading definite article, if any.
+        """
+        return self.__split_article(phrase)[1]
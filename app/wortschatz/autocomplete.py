@@ -0,0 +1,100 @@
+"""
+author: @guu8hc
+"""
+
+import threading
+from bisect import bisect_left
+
+from .normalizer import normalize_german
+
+# lower value wins when the same word shows up in several columns
+PRIORITY = {"de": 0, "en": 1, "keyword": 2}
+
+class Autocomplete:
+    """
+    Prefix completion over German and English headwords and keywords.
+    Entries are kept as a sorted list of normalized keys, so a lookup is one
+    bisect plus a short scan over the matching range. Vocabulary writes
+    (Wortschatz.on_change) rebuild the list, which is fine as writes are rare.
+    Rebuilds are serialized by a lock so that concurrent writes are never lost;
+    lookups read the index without locking.
+    e.g.:
+        complete("mae") -> [{"word": "Mädchen", "lang": "de", "translation": "Girl"}]
+    """
+    def __init__(self, rows=()):
+        """
+        Args:
+            rows (iterable): (de, gender, en, keywords) tuples, e.g. from Wortschatz.get_all().
+        """
+        self.rows = {}  # de -> row
+        self.index = ([], [])  # (sorted keys, entries), swapped as one object
+        self.lock = threading.Lock()
+        self.build(rows)
+
+    def build(self, rows):
+        """
+        (Re)build the index from (de, gender, en, keywords) rows.
+        """
+        with self.lock:
+            self.__build(rows)
+
+    def apply(self, old_row, new_row):
+        """
+        Follow a single vocabulary write (Wortschatz.on_change listener).
+        """
+        with self.lock:
+            rows = dict(self.rows)
+            if old_row:
+                rows.pop(old_row[0], None)
+            if new_row:
+                rows[new_row[0]] = new_row
+            self.__build(rows.values())
+
+    def __build(self, rows):
+        """
+        Build the index; the caller holds the lock.
+        """
+        self.rows = {row[0]: row for row in rows}
+        best = {}  # (key, word) -> (lang, translation)
+
+        def offer(word, lang, translation):
+            word = (word or "").strip()
+            if not word:
+                return
+            slot = (normalize_german(word), word)
+            if slot not in best or PRIORITY[lang] < PRIORITY[best[slot][0]]:
+                best[slot] = (lang, translation)
+
+        for de, _, en, keywords in self.rows.values():
+            offer(de, "de", en)
+            offer(en, "en", de)
+            for keyword in (keywords or "").split(","):
+                offer(keyword, "keyword", None)
+
+        ordered = sorted(best.items())
+        self.index = (
+            [key for (key, _), _ in ordered],
+            [{"word": word, "lang": lang, "translation": translation} for (_, word), (lang, translation) in ordered],
+        )
+
+    def complete(self, prefix: str, limit: int = 10) -> list:
+        """
+        Get up to `limit` entries whose normalized form starts with the normalized prefix.
+        Umlauts may be typed as ae/oe/ue, ß as ss.
+        Returns:
+            list: Entries in alphabetical order of their normalized form.
+        """
+        prefix = normalize_german(prefix or "")
+        if not prefix or limit <= 0:
+            return []
+
+        keys, entries = self.index
+        result = []
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and len(result) < limit and keys[i].startswith(prefix):
+            result.append(entries[i])
+            i += 1
+        return result
+
+    def __len__(self):
+        return len(self.index[0])
@@ -0,0 +1,29 @@
+"""
+author: @guu8hc
+"""
+
+import unicodedata
+import re
+
+TRANSLIT = {
+    "ä": "ae", "ö": "oe", "ü": "ue",
+    "Ä": "ae", "Ö": "oe", "Ü": "ue",
+    "ß": "ss"
+}
+
+def normalize_german(word: str) -> str:
+    """
+    Normalize a German word or phrase for comparison.
+    Input is composed (NFC) first so that decomposed umlauts, e.g. from macOS or
+    pasted text, are transliterated too. Umlauts and ß are transliterated before
+    NFKD, otherwise the decomposition would split them into a base letter and a
+    combining mark first.
+    e.g.:
+        normalize_german("Mädchen  Straße") -> "maedchen strasse"
+        normalize_german(" Apfel ")         -> "apfel"
+    """
+    word = unicodedata.normalize('NFC', word).lower()
+    word = ''.join(TRANSLIT.get(c, c) for c in word)
+    word = unicodedata.normalize('NFKD', word)
+    word = re.sub(r'\s+', ' ', word.strip())  # collapse multiple spaces
+    return word
@@ -2,10 +2,10 @@
 author: @guu8hc
 """
 
-import unicodedata
-import re
-
 from app.database import deen_db
+from app.settings import ANSWER_MAX_TYPOS, DEBUG_MODE
+
+from .answer_scorer import AnswerScorer, CORRECT
 
 class SessionHandler:
     """
@@ -18,6 +18,8 @@ class SessionHandler:
         """
         self.db = deen_db
         self.questions = []
+        self.scorer = AnswerScorer((word[0] for word in self.db.get_all()), max_typos=ANSWER_MAX_TYPOS)
+        self.db.on_change(self.scorer.apply)
 
     def set_session(self, questions=10, topic=None):
         data = self.db.get_questions_by_keyword(questions=questions, keyword=topic)
@@ -50,38 +52,16 @@ class SessionHandler:
         else:
             return "das"
         
-    def __normalize_german(self, word: str) -> bool:
-        """
-        validate("Mädchen straße", "Maedchenstraße")  # True
-        validate("Gute nacht", "gute Nacht")          # True
-        validate("schloss", "Schloß")                 # True
-        validate("gross", "groß")                     # True
-        validate("Apfel", "Apfel")                    # True
-        validate(" Apfel ", "Apfel")                  # True
-        validate("gutemorgen", "Gute Morgen")         # False (if spacing matters)
-        """
-        translit = {
-            "ä": "ae", "ö": "oe", "ü": "ue",
-            "Ä": "ae", "Ö": "oe", "Ü": "ue",
-            "ß": "ss"
-        }
-        word = word.lower()
-        word = unicodedata.normalize('NFKD', word)
-        word = ''.join(translit.get(c, c) for c in word)
-        word = re.sub(r'\s+', ' ', word.strip())  # collapse multiple spaces
-        return word
-
     def get_questions(self) -> list:
         """
         Get questions for the session.
         """
         return list(self.questions.keys())
     
-    def validate(self, question: str, answer: str) -> bool:
+    def __get_expectation(self, question: str) -> str:
         """
-        Validate user input against actual answers.
+        Get the expected answer (article and translation) for a question.
         """
-        
         # get definite article
         artikel = self.__get_definiter_artikel(self.questions[question.capitalize()]['gender'])
 
@@ -89,11 +69,16 @@ class SessionHandler:
         translation = self.questions[question.capitalize()]['de']
 
         # join article and translation
-        expectation = f"{artikel} {translation}"
+        return f"{artikel} {translation}"
 
-        # normalize both expectation and answer
-        expectation = self.__normalize_german(expectation)
-        answer = self.__normalize_german(answer)
+    def score(self, question: str, answer: str) -> dict:
+        """
+        Score user input against actual answers, tolerating small typos.
+        e.g.:
+            score("Cat", "die Katz") -> {"result": False, "verdict": "near-miss", "distance": 1, "suggestion": None}
+        """
+        scored = self.scorer.score(self.__get_expectation(question), answer)
 
-        print(f"[DEBUG] Validating: {question} -> {answer} against {expectation}")
-        return answer == expectation
+        if DEBUG_MODE:
+            print(f"[DEBUG] session_handler.py: Scoring: {question} -> {answer}: {scored}")
+        return {"result": scored["verdict"] == CORRECT, **scored}
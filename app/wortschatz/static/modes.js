@@ -1,5 +1,6 @@
 document.addEventListener("DOMContentLoaded", function() {
     redirect_logout();
+    load_topics();
 
     buttons = document.querySelectorAll('.btn');
     buttons.forEach(button => {
@@ -47,6 +48,22 @@ function redirect_logout(){
     });
 }
 
+function load_topics() {
+    // The browser revalidates with the ETag, unchanged catalogues come back as 304
+    fetch('/wortschatz/topics')
+        .then(response => response.json())
+        .then(data => {
+            const topicList = document.getElementById('topic-list');
+            data.topics.forEach(entry => {
+                const option = document.createElement('option');
+                option.value = entry.topic;
+                option.label = `${entry.topic} (${entry.count})`;
+                topicList.appendChild(option);
+            });
+        })
+        .catch(error => console.error('[ERROR] modes.js: Could not load topics', error));
+}
+
 function redirect_session(questions, topic) {
     const url = `/wortschatz/session?questions=${questions}&topic=${topic}`;
     window.location.href = url;
@@ -19,6 +19,10 @@ function validateAnswer() {
         .then(data => {
             if (data.result) {
                 alert("Correct!");
+            } else if (data.verdict === "near-miss") {
+                alert(`Almost! ${data.distance} typo(s) away.`);
+            } else if (data.suggestion) {
+                alert(`Incorrect! Did you mean "${data.suggestion}"?`);
             } else {
                 alert("Incorrect!");
             }
@@ -0,0 +1,92 @@
+"""
+author: @guu8hc
+"""
+
+import hashlib
+import json
+import threading
+from collections import Counter
+
+from app.database.wortschatz import Wortschatz
+
+def split_keywords(keywords) -> set:
+    """
+    Split a comma-separated keywords value into its distinct, stripped keywords.
+    """
+    return {keyword.strip() for keyword in (keywords or "").split(",") if keyword.strip()}
+
+class TopicCatalogue:
+    """
+    Materialized keyword -> word count catalogue for the modes page.
+    Counts are computed once from DE_EN.keywords and then updated incrementally
+    on writes made through Wortschatz.add_word / remove_word. Writes from other
+    connections are picked up through SQLite's data_version, which triggers a
+    full rebuild on the next read.
+    The JSON body and its ETag are cached until the counts change.
+    """
+    def __init__(self, db: Wortschatz):
+        """
+        Args:
+            db (Wortschatz): The vocabulary database.
+        """
+        self.db = db
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.data_version = None
+        self.body = None
+        self.etag = None
+
+        self.rebuild()
+        self.db.on_change(self.apply)
+
+    def rebuild(self):
+        """
+        Recount all keywords from the database.
+        """
+        # Holding the database's write lock across version read, count and swap keeps
+        # add_word / remove_word (and thus apply) out until the new counts are in place:
+        # a write is then either already counted or applied afterwards, never lost.
+        with self.db.write_lock:
+            # read the version first: a commit from another connection racing the count
+            # then triggers another rebuild
+            data_version = self.db.data_version()
+
+            counts = Counter()
+            for keywords in self.db.get_all_keywords():
+                counts.update(split_keywords(keywords))
+
+            with self.lock:
+                self.counts = counts
+                self.data_version = data_version
+                self.body = None
+
+    def apply(self, old_row, new_row):
+        """
+        Update counts for a single vocabulary write (Wortschatz.on_change listener).
+        Runs under the database's write lock, so it waits for a running rebuild.
+        """
+        removed = split_keywords(old_row[3]) if old_row else set()
+        added = split_keywords(new_row[3]) if new_row else set()
+
+        with self.lock:
+            self.counts.subtract(removed - added)
+            self.counts.update(added - removed)
+            self.counts = +self.counts  # drop keywords that reached zero
+            self.body = None
+
+    def get(self):
+        """
+        Get the serialized catalogue.
+        Returns:
+            tuple: (body, etag), where body is a JSON string of
+                {"topics": [{"topic": str, "count": int}]} sorted by count, then name.
+        """
+        if self.db.data_version() != self.data_version:
+            self.rebuild()
+
+        with self.lock:
+            if self.body is None:
+                topics = sorted(self.counts.items(), key=lambda item: (-item[1], item[0].lower()))
+                self.body = json.dumps({"topics": [{"topic": topic, "count": count} for topic, count in topics]})
+                self.etag = hashlib.sha1(self.body.encode()).hexdigest()
+            return self.body, self.etag
@@ -2,18 +2,30 @@
 author: @guu8hc
 """
 
-from flask import render_template, request, jsonify
+from flask import render_template, request, jsonify, Response
 
 from app.util import login_required
 from app.util import get_git_branch
 
+from app.database import deen_db
+from app.settings import SUGGEST_LIMIT
+
 from . import wortschatz_bp
+from .autocomplete import Autocomplete
 from .session_handler import SessionHandler
+from .topic_catalogue import TopicCatalogue
 
 
 # Initialize the session handler
 session_handler = SessionHandler()
 
+# Build the autocomplete index once, lookups are served from memory
+autocomplete = Autocomplete(deen_db.get_all())
+deen_db.on_change(autocomplete.apply)
+
+# Materialize the topic catalogue once, it follows vocabulary writes
+topic_catalogue = TopicCatalogue(deen_db)
+
 @wortschatz_bp.route('/modes')
 @login_required
 def modes():
@@ -27,6 +39,24 @@ def modes():
     """
     return render_template('wortschatz/modes.html', gitv=get_git_branch())
 
+@wortschatz_bp.route('/topics', methods=['GET'])
+@login_required
+def topics():
+    """
+    List the available topics with their word counts.
+
+    Endpoint: wortschatz/topics
+
+    Returns:
+        json: {"topics": [{"topic": str, "count": int}]}, or 304 if the client's ETag is current.
+    """
+    body, etag = topic_catalogue.get()
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'  # always revalidate, 304 is cheap
+    return response.make_conditional(request)
+
 # Requirement: get_question
 # Requester  : @Lyon
 @wortschatz_bp.route('/session', methods=['GET'])
@@ -72,13 +102,35 @@ def session_validate():
     e.g.    : wortschatz/session/validate?question=cat&answer=die%20Katze
     
     Returns:
-        str: The rendered HTML of the session validation page.
+        json: {"result": bool, "verdict": "correct" | "near-miss" | "wrong",
+               "distance": int | None, "suggestion": str | None}
     """
     # Extract query parameters
     question = request.args.get('question')
     answer = request.args.get('answer')
 
     # Validation via session handler
-    result = session_handler.validate(question, answer) if session_handler else None
+    result = session_handler.score(question, answer) if session_handler else None
+
+    return jsonify(result) if result is not None else jsonify({'error': 'Session handler not initialized'})
+
+@wortschatz_bp.route('/suggest', methods=['GET'])
+@login_required
+def suggest():
+    """
+    Autocomplete German and English headwords and keywords.
+
+    Endpoint: wortschatz/suggest?q=<prefix>&limit=<limit>
+    e.g.    : wortschatz/suggest?q=mae
+
+    Args (from query parameters):
+        q     (str): The prefix typed so far, umlauts may be written as ae/oe/ue.
+        limit (int): Maximum number of suggestions, capped at SUGGEST_LIMIT.
+    Returns:
+        json: {"suggestions": [{"word": str, "lang": "de" | "en" | "keyword", "translation": str | None}]}
+    """
+    # Extract query parameters
+    prefix = request.args.get('q', '')
+    limit = min(request.args.get('limit', SUGGEST_LIMIT, type=int), SUGGEST_LIMIT)
 
-    return jsonify({'result': result}) if result is not None else jsonify({'error': 'Session handler not initialized'})
+    return jsonify({'suggestions': autocomplete.complete(prefix, limit)})
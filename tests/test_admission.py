@@ -0,0 +1,153 @@
+"""
+author: @GUU8HC
+tests for app/authentication/admission.py
+"""
+
+import threading
+
+import pytest
+from flask import Flask, jsonify
+
+from app.authentication.admission import AdmissionController, TokenBucketStore
+
+def test_take_until_empty_then_refill():
+    store = TokenBucketStore(rate=1.0, burst=3, max_keys=10)
+
+    assert [store.take("ip", now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert store.take("ip", now=0.0) == pytest.approx(1.0)
+    assert store.take("ip", now=0.25) == pytest.approx(0.75)
+    assert store.take("ip", now=1.0) == 0.0
+    assert store.take("ip", now=1.0) == pytest.approx(1.0)
+
+def test_refill_is_capped_at_burst():
+    store = TokenBucketStore(rate=1.0, burst=2, max_keys=10)
+    store.take("ip", now=0.0)
+
+    assert [store.take("ip", now=100.0) for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+def test_wait_does_not_take_a_token():
+    store = TokenBucketStore(rate=0.5, burst=1, max_keys=10)
+
+    assert store.wait("ip", now=0.0) == 0.0
+    assert len(store) == 0
+    assert store.take("ip", now=0.0) == 0.0
+    assert store.wait("ip", now=0.0) == pytest.approx(2.0)
+    assert store.wait("ip", now=1.0) == pytest.approx(1.0)
+
+def test_rejected_take_is_not_stored():
+    store = TokenBucketStore(rate=1.0, burst=1, max_keys=10)
+    store.take("ip", now=0.0)
+
+    assert store.take("ip", now=0.5) == pytest.approx(0.5)
+    assert store.buckets["ip"] == (0.0, 0.0)
+
+def test_refund():
+    store = TokenBucketStore(rate=1.0, burst=2, max_keys=10)
+    store.take("ip", now=0.0)
+    store.take("ip", now=0.0)
+
+    store.refund("ip")
+    assert store.take("ip", now=0.0) == 0.0
+
+    # never above burst, and unknown keys are not created
+    store.refund("ip")
+    store.refund("ip")
+    store.refund("ip")
+    store.refund("other")
+    assert store.buckets["ip"][0] == 2.0
+    assert "other" not in store.buckets
+
+def test_idle_buckets_are_evicted():
+    store = TokenBucketStore(rate=1.0, burst=2, max_keys=10)  # idle_ttl = 2s
+    store.take("a", now=0.0)
+    store.take("b", now=1.0)
+
+    store.take("c", now=2.0)
+    assert list(store.buckets) == ["b", "c"]
+
+    store.take("d", now=10.0)
+    assert list(store.buckets) == ["d"]
+
+def test_store_is_capped_at_max_keys_in_lru_order():
+    store = TokenBucketStore(rate=0.001, burst=5, max_keys=3)
+    for i, key in enumerate("abc"):
+        store.take(key, now=float(i))
+    store.take("a", now=3.0)  # a becomes most recently used
+    store.take("d", now=4.0)
+
+    assert list(store.buckets) == ["c", "a", "d"]
+    assert len(store) == 3
+
+def test_admit_charges_both_buckets():
+    controller = AdmissionController(ip_rate=0.001, ip_burst=2, user_rate=0.001, user_burst=5, max_concurrent=1, max_keys=100)
+
+    assert controller.admit("1.2.3.4", "alice") == 0.0
+    assert controller.admit("1.2.3.4", "Bob") == 0.0
+    assert controller.admit("1.2.3.4", "carol") > 0
+    assert controller.admit("5.6.7.8", "ALICE") == 0.0
+
+    assert len(controller.user_buckets) == 2  # alice, bob; carol was never charged
+    assert controller.user_buckets.buckets["alice"][0] == pytest.approx(3.0, abs=0.01)
+
+def test_throttled_ip_does_not_drain_another_users_bucket():
+    controller = AdmissionController(ip_rate=0.001, ip_burst=1, user_rate=0.001, user_burst=2, max_concurrent=1, max_keys=100)
+    controller.admit("attacker", "victim")
+
+    for _ in range(20):
+        assert controller.admit("attacker", "victim") > 0
+
+    assert controller.admit("victim-ip", "victim") == 0.0
+
+def test_refund_returns_both_tokens():
+    controller = AdmissionController(ip_rate=0.001, ip_burst=1, user_rate=0.001, user_burst=1, max_concurrent=1, max_keys=100)
+    controller.admit("ip", "alice")
+    controller.refund("ip", "alice")
+
+    assert controller.admit("ip", "alice") == 0.0
+
+@pytest.fixture(name="guarded")
+def fixture_guarded():
+    controller = AdmissionController(ip_rate=0.001, ip_burst=2, user_rate=0.001, user_burst=10, max_concurrent=1, max_keys=100)
+    app = Flask(__name__)
+    entered, release = threading.Event(), threading.Event()
+
+    @app.route('/login/<username>')
+    @controller.guard
+    def login(username):
+        if username == "slow":
+            entered.set()
+            release.wait(5)
+        return jsonify({'result': True})
+
+    return app, controller, entered, release
+
+def test_guard_rejects_with_429_and_retry_after(guarded):
+    app, _, _, _ = guarded
+    client = app.test_client()
+
+    assert client.get('/login/alice').status_code == 200
+    assert client.get('/login/alice').status_code == 200
+
+    response = client.get('/login/alice')
+    assert response.status_code == 429
+    assert response.get_json() == {'result': False, 'error': 'Too many attempts'}
+    assert int(response.headers['Retry-After']) >= 1
+
+def test_guard_refunds_when_all_slots_are_busy(guarded):
+    app, controller, entered, release = guarded
+    slow = threading.Thread(target=lambda: app.test_client().get('/login/slow', environ_base={'REMOTE_ADDR': '10.0.0.1'}))
+    slow.start()
+    try:
+        assert entered.wait(5)
+        response = app.test_client().get('/login/alice', environ_base={'REMOTE_ADDR': '10.0.0.2'})
+        assert response.status_code == 429
+        assert response.get_json()['error'] == 'Server busy'
+    finally:
+        release.set()
+        slow.join()
+
+    # the busy rejection did not cost 10.0.0.2 one of its two tokens
+    client = app.test_client()
+    for _ in range(2):
+        assert client.get('/login/alice', environ_base={'REMOTE_ADDR': '10.0.0.2'}).status_code == 200
+    assert len(controller.ip_buckets) == 2
@@ -0,0 +1,126 @@
+"""
+author: @guu8hc
+tests for app/wortschatz/answer_scorer.py
+"""
+
+import random
+import unicodedata
+
+import pytest
+
+from app.wortschatz.answer_scorer import AnswerScorer, DeleteIndex, bounded_levenshtein, CORRECT, NEAR_MISS, WRONG
+
+def levenshtein(a, b):
+    """
+    Reference implementation: the full dynamic programming table.
+    """
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, start=1):
+        current = [i]
+        for j, other in enumerate(b, start=1):
+            current.append(min(previous[j - 1] + (char != other), previous[j] + 1, current[j - 1] + 1))
+        previous = current
+    return previous[-1]
+
+def random_word(rng, alphabet="abcde", max_length=10):
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+
+def mutate(rng, word, edits, alphabet="abcde"):
+    """
+    Apply up to `edits` random insertions, deletions or substitutions.
+    """
+    for _ in range(edits):
+        i = rng.randint(0, len(word))
+        op = rng.choice("ids")
+        if op == "i":
+            word = word[:i] + rng.choice(alphabet) + word[i:]
+        elif word and i < len(word):
+            word = word[:i] + (rng.choice(alphabet) if op == "s" else "") + word[i + 1:]
+    return word
+
+@pytest.mark.parametrize("limit", [0, 1, 2, 3])
+def test_bounded_levenshtein_matches_full_levenshtein(limit):
+    rng = random.Random(limit)
+    for _ in range(2000):
+        a = random_word(rng)
+        b = mutate(rng, a, rng.randint(0, 4)) if rng.random() < 0.7 else random_word(rng)
+        expected = levenshtein(a, b)
+        assert bounded_levenshtein(a, b, limit) == (expected if expected <= limit else limit + 1), (a, b)
+
+@pytest.mark.parametrize("affix_length", [2, 3, 5, 7])
+def test_delete_index_search_matches_brute_force(affix_length):
+    rng = random.Random(affix_length)
+    words = {random_word(rng, max_length=12) for _ in range(400)} - {""}
+    index = DeleteIndex(words, max_distance=2, affix_length=affix_length)
+
+    queries = [mutate(rng, rng.choice(sorted(words)), rng.randint(0, 3)) for _ in range(300)]
+    for query in queries:
+        distances = sorted((levenshtein(query, word), word) for word in words)
+        for max_distance in (0, 1, 2):
+            expected = [(distance, word) for distance, word in distances if distance <= max_distance]
+            assert index.search(query, max_distance) == expected, (query, max_distance)
+
+def test_delete_index_finds_compounds_sharing_a_prefix_or_suffix():
+    # differences in the middle of long words are outside both affixes
+    words = ["haustuer", "haushalt", "haustier", "hausaufgabe", "aufgabe", "gartentuer", "gartenhaustuer"]
+    index = DeleteIndex(words, max_distance=2)
+
+    for query in ["haustur", "hausaufgabr", "gartenhaustuerr", "gartenhauztuer", "gartenhxxstuer"]:
+        expected = sorted((distance, word) for distance, word in ((levenshtein(query, word), word) for word in words) if distance <= 2)
+        assert index.search(query, 2) == expected, query
+
+def test_delete_index_remove():
+    index = DeleteIndex(["katze", "kasse", "tatze"], max_distance=2, affix_length=3)
+    index.remove("kasse")
+    index.remove("missing")
+
+    assert len(index) == 2
+    assert index.search("katze", 2) == [(0, "katze"), (1, "tatze")]
+    assert all(index.prefixes.values()) and all(index.suffixes.values())
+
+    index.add("kasse")
+    assert index.search("katze", 2) == [(0, "katze"), (1, "tatze"), (2, "kasse")]
+
+@pytest.fixture(name="scorer")
+def fixture_scorer():
+    return AnswerScorer(["Hund", "Katze", "Mädchen", "Haustür", "Haushalt", "Tatze"])
+
+@pytest.mark.parametrize("expectation, answer, verdict, distance", [
+    ("die Katze", "die Katze", CORRECT, 0),
+    ("die Katze", "  DIE   katze ", CORRECT, 0),
+    ("das Mädchen", "das Maedchen", CORRECT, 0),
+    ("das Mädchen", unicodedata.normalize('NFD', "das Mädchen"), CORRECT, 0),
+    ("die Katze", "die Katz", NEAR_MISS, 1),
+    ("die Haustür", "die Hausdur", NEAR_MISS, 2),
+    ("der Hund", "die Hund", WRONG, None),
+    ("der Hund", "Hund", WRONG, None),
+    ("der Hund", "der Hunde", NEAR_MISS, 1),
+    ("der Hund", "der Mund", NEAR_MISS, 1),
+    ("der Hund", "der Hand", NEAR_MISS, 1),
+    ("der Hund", "der Hnd", NEAR_MISS, 1),
+    ("der Hund", "der Hudn", WRONG, None),
+    ("die Katze", "die Tatze", NEAR_MISS, 1),
+])
+def test_score(scorer, expectation, answer, verdict, distance):
+    scored = scorer.score(expectation, answer)
+    assert (scored["verdict"], scored["distance"]) == (verdict, distance)
+
+def test_score_wrong_article_suggests_nothing_for_a_known_noun(scorer):
+    assert scorer.score("der Hund", "die Hund")["suggestion"] is None
+    assert scorer.score("die Katze", "der Katz")["suggestion"] is None
+
+def test_score_wrong_answer_suggests_the_closest_headword(scorer):
+    assert scorer.score("die Katze", "die Haustur")["suggestion"] == "Haustür"
+    assert scorer.score("die Katze", "das Xylophon")["suggestion"] is None
+
+def test_apply_follows_writes(scorer):
+    scorer.apply(None, ("Straße", "die", "Street", ""))
+    assert scorer.suggest("die Strase") == "Straße"
+
+    scorer.apply(("Straße", "die", "Street", ""), None)
+    assert scorer.suggest("die Strase") is None
+    assert "strasse" not in scorer.index.words
+
+def test_allowed_typos_grows_with_word_length(scorer):
+    assert [scorer.allowed_typos(word) for word in ("ei", "hund", "katzen", "haustuer")] == [1, 1, 1, 2]
+    assert AnswerScorer([], max_typos=1).allowed_typos("haustuer") == 1